@@ -1,28 +1,37 @@
-// AWS SDK - Bedrock Agent
+// Node.js - Crypto
 import {
+  createHmac,
+  randomUUID,
+  timingSafeEqual,
+} from 'crypto';
+
+// AWS SDK - Bedrock Agent (loaded on first use)
+import type {
   BedrockAgentClient,
-  GetIngestionJobCommand,
   IngestionJobStatus,
-  StartIngestionJobCommand,
 } from '@aws-sdk/client-bedrock-agent';
 
 // AWS SDK - Bedrock Agent Runtime
 import {
   BedrockAgentRuntimeClient,
   RetrieveAndGenerateCommand,
+  RetrieveAndGenerateConfiguration,
   RetrieveAndGenerateType,
   RetrievedReference,
 } from '@aws-sdk/client-bedrock-agent-runtime';
 
 // AWS SDK - DynamoDB
-import { DynamoDBClient } from '@aws-sdk/client-dynamodb';
+import {
+  ConditionalCheckFailedException,
+  DynamoDBClient,
+} from '@aws-sdk/client-dynamodb';
 
 // AWS SDK - DynamoDB - Document Client
 import {
   BatchWriteCommand,
   DynamoDBDocumentClient,
   GetCommand,
-  PutCommand,
+  UpdateCommand,
 } from '@aws-sdk/lib-dynamodb';
 
 // AWS SDK - S3
@@ -32,9 +41,6 @@ import {
   S3Client,
 } from '@aws-sdk/client-s3';
 
-// AWS SDK - S3 Request Presigner
-import { getSignedUrl } from '@aws-sdk/s3-request-presigner';
-
 // Slack - Bolt
 import {
   AllMiddlewareArgs,
@@ -65,32 +71,68 @@ const [slackBotToken, slackSigningSecret, knowledgeBaseId, dataSourceId, dataSou
   process.env.REFERENCE_TABLE_NAME,
 ];
 
-// AWS SDK - Bedrock Agent - Client
-const bedrockAgent = new BedrockAgentClient();
+// AWS SDK - Bedrock Agent - Client (created on first use)
+let bedrockAgent: BedrockAgentClient | undefined;
 
 // AWS SDK - Bedrock Agent Runtime - Client
-const bedrockAgentRuntime = new BedrockAgentRuntimeClient();
+const bedrockAgentRuntime = new BedrockAgentRuntimeClient({
+  maxAttempts: 3,
+});
+
+// AWS SDK - Bedrock Agent Runtime - Retrieve and Generate Timeout
+const retrieveAndGenerateTimeout = 60 * 1000;
+
+// AWS SDK - Bedrock Agent Runtime - Retrieve and Generate Configuration
+const retrieveAndGenerateConfiguration: RetrieveAndGenerateConfiguration = {
+  type: RetrieveAndGenerateType.KNOWLEDGE_BASE,
+  knowledgeBaseConfiguration: {
+    knowledgeBaseId,
+    modelArn,
+  },
+};
 
 // AWS SDK - DynamoDB - Client
-const dynamodb = DynamoDBDocumentClient.from(new DynamoDBClient());
+const dynamodb = DynamoDBDocumentClient.from(new DynamoDBClient({
+  maxAttempts: 3,
+  retryMode: 'adaptive',
+}));
 
 // AWS SDK - S3 - Client
 const s3 = new S3Client();
 
+// Max Session Turns
+const maxSessionTurns = 20;
+
+// Session Lock Timeout (seconds)
+const sessionLockTimeout = 60 * 2;
+
+// Reference Cache
+const referenceCache = new Map<string, RetrievedReference>();
+
+// Reference Cache Size
+const referenceCacheSize = 1000;
+
 // Slack - AWS Lambda Receiver
 const receiver = new AwsLambdaReceiver({
   signingSecret: slackSigningSecret,
 });
 
+// Slack - AWS Lambda Event and Response
+type AwsEvent = Parameters<ReturnType<typeof receiver.toHandler>>[0];
+type AwsResponse = Awaited<ReturnType<ReturnType<typeof receiver.toHandler>>>;
+
 // Slack - App
 const slack = new App({
   token: slackBotToken,
   receiver,
 });
 
+// Slack - AWS Lambda Handler
+const slackHandler = receiver.toHandler();
+
 // Slack - App Mention Event Handler
 slack.event('app_mention', async ({ client, event }: AllMiddlewareArgs & { event: AppMentionEventWithFiles }) => {
-  if (!event.subtype) {
+  if (!event.subtype && !event.bot_id) {
     if (!event.files) {
       await answer(
         client,
@@ -113,7 +155,7 @@ slack.event('app_mention', async ({ client, event }: AllMiddlewareArgs & { event
 
 // Slack - Direct Message Handler
 slack.message(async ({ client, event }) => {
-  if (!event.subtype) {
+  if (!event.subtype && !event.bot_id) {
     if (!event.files) {
       await answer(
         client,
@@ -166,28 +208,101 @@ slack.action('open_reference_url', async ({ ack }) => {
 
 // Answer
 const answer = async (client: WebClient, channel: string, ts: string, threadTs: string, text: string): Promise<void> => {
-  // Add emoji of thinking face.
-  await client.reactions.add({
-    name: 'thinking_face',
-    channel,
-    timestamp: ts,
-  });
+  // Session Lock Owner
+  const owner = randomUUID();
+
+  // Whether the text has been queued for the invocation holding the lock.
+  let queued = false;
+
+  try {
+    // Queue the text if the thread is already being answered by another invocation.
+    while (!queued && !await acquireSessionLock(channel, threadTs, owner)) {
+      queued = await putPendingText(channel, threadTs, text);
+    }
+  } catch (e: any) {
+    // Post error message in thread.
+    await postMessage(client, channel, threadTs, e.message);
+
+    return;
+  }
+
+  if (queued) {
+    // Add emoji of eyes to show that the text will be answered with the current question.
+    await client.reactions.add({
+      name: 'eyes',
+      channel,
+      timestamp: ts,
+    });
+
+    return;
+  }
+
+  // Whether the session lock is still held.
+  let locked = true;
+
+  try {
+    // Texts
+    let texts = [text];
+
+    while (locked) {
+      if (texts.length) {
+        // Generate answer for all texts received so far.
+        await generateAnswer(client, channel, threadTs, texts.join('\n'));
+      }
+
+      // Take texts queued while generating the answer, extending the lock.
+      const pendingTexts = await takePendingTexts(channel, threadTs, owner);
+
+      if (!pendingTexts) {
+        // The lock has expired and been taken over by another invocation.
+        locked = false;
+      } else if (pendingTexts.length) {
+        texts = pendingTexts;
+      } else {
+        // Release lock unless texts were queued in the meantime.
+        texts = [];
+        locked = !await releaseSessionLock(channel, threadTs, owner);
+      }
+    }
+  } catch (e: any) {
+    // Post error message in thread.
+    await postMessage(client, channel, threadTs, e.message);
+  } finally {
+    if (locked) {
+      // Release lock and discard queued texts so that they are not attached to later questions.
+      await discardSessionLock(channel, threadTs, owner);
+    }
+  }
+};
+
+// Generate Answer
+const generateAnswer = async (client: WebClient, channel: string, threadTs: string, text: string): Promise<void> => {
+  // Post placeholder message in thread while generating the answer.
+  const placeholder = postMessage(client, channel, threadTs, ':thinking_face: 回答を生成しています…');
+
+  // Get session.
+  const session = getSession(channel, threadTs);
+
+  // Whether the placeholder message has been updated with the answer.
+  let answered = false;
 
   try {
     // Retrieve and generate.
-    const { sessionId, citations } = await bedrockAgentRuntime.send(new RetrieveAndGenerateCommand({
-      sessionId: await getSessionId(channel, threadTs),
-      input: {
-        text,
-      },
-      retrieveAndGenerateConfiguration: {
-        type: RetrieveAndGenerateType.KNOWLEDGE_BASE,
-        knowledgeBaseConfiguration: {
-          knowledgeBaseId,
-          modelArn,
-        },
-      },
-    }));
+    const [{ turns }, { sessionId, citations }] = await Promise.all([
+      session,
+      session.then(({ sessionId }) => {
+        return bedrockAgentRuntime.send(new RetrieveAndGenerateCommand({
+          sessionId,
+          input: {
+            text,
+          },
+          retrieveAndGenerateConfiguration,
+        }), {
+          abortSignal: AbortSignal.timeout(retrieveAndGenerateTimeout),
+        });
+      }),
+      placeholder,
+    ]);
 
     if (!sessionId) {
       throw Error('回答の生成に失敗しました。');
@@ -214,31 +329,36 @@ const answer = async (client: WebClient, channel: string, ts: string, threadTs:
       return answer;
     }, '');
 
-    // Post message in thread.
-    const messageId = await postMessage(client, channel, threadTs, answer, references);
+    // Update placeholder message with answer.
+    const messageId = await placeholder.then((ts) => {
+      return updateMessage(client, channel, ts, answer, references);
+    });
 
-    // Put session id.
-    await putSessionId(channel, threadTs, sessionId);
+    answered = true;
 
-    // Put references.
-    await putReferences(messageId, references);
+    await Promise.all([
+      // Put references.
+      putReferences(messageId, references),
+      // Put session.
+      putSession(channel, threadTs, sessionId, turns + 1),
+    ]);
   } catch (e: any) {
-    // Post error message in thread.
-    await postMessage(client, channel, threadTs, e.message);
-  } finally {
-    // Remove emoji of thinking face.
-    await client.reactions.remove({
-      name: 'thinking_face',
-      channel,
-      timestamp: ts,
-    });
+    if (answered) {
+      // Post error message in thread, keeping the answer.
+      await postMessage(client, channel, threadTs, e.message);
+    } else {
+      // Update placeholder message with error message.
+      await placeholder.then((ts) => {
+        return updateMessage(client, channel, ts, e.message);
+      });
+    }
   }
 };
 
 // Upload Files and Sync
 const uploadFilesAndSync = async (client: WebClient, channel: string, ts: string, threadTs: string, files: File[]): Promise<void> => {
-  // Add emoji of saluting face.
-  await client.reactions.add({
+  // Add emoji of saluting face while uploading files.
+  const reaction = client.reactions.add({
     name: 'saluting_face',
     channel,
     timestamp: ts,
@@ -246,7 +366,10 @@ const uploadFilesAndSync = async (client: WebClient, channel: string, ts: string
 
   try {
     // Put files.
-    await putFiles(files);
+    await Promise.all([
+      putFiles(files),
+      reaction,
+    ]);
 
     // Start ingestion job.
     const ingestionJobId = await startIngestionJob(
@@ -289,11 +412,13 @@ const uploadFilesAndSync = async (client: WebClient, channel: string, ts: string
     // Post error message in thread.
     await postMessage(client, channel, threadTs, e.message);
   } finally {
-    // Remove emoji of saluting face.
-    await client.reactions.remove({
-      name: 'saluting_face',
-      channel,
-      timestamp: ts,
+    // Remove emoji of saluting face once it has been added.
+    await reaction.then(() => {
+      return client.reactions.remove({
+        name: 'saluting_face',
+        channel,
+        timestamp: ts,
+      });
     });
   }
 };
@@ -327,6 +452,9 @@ const openReferenceModal = async (client: WebClient, channel: string, ts: string
     // File Name
     const fileName = getFileNameFromUri(uri);
 
+    // AWS SDK - S3 Request Presigner (loaded on first use)
+    const { getSignedUrl } = await import('@aws-sdk/s3-request-presigner');
+
     // URL
     const url = await getSignedUrl(s3, new GetObjectCommand({
       Bucket: dataSourceBucketName,
@@ -372,8 +500,8 @@ const openReferenceModal = async (client: WebClient, channel: string, ts: string
   }));
 };
 
-// Get Session ID
-const getSessionId = async (channel: string, threadTs: string): Promise<string | undefined> => {
+// Get Session
+const getSession = async (channel: string, threadTs: string): Promise<{ sessionId?: string, turns: number }> => {
   const { Item: item } = await dynamodb.send(new GetCommand({
     TableName: sessionTableName,
     Key: {
@@ -382,26 +510,192 @@ const getSessionId = async (channel: string, threadTs: string): Promise<string |
     },
   }));
 
-  return item?.sessionId;
+  // Start a new session once the thread reaches the maximum number of turns.
+  if (!item?.sessionId || item.turns >= maxSessionTurns) {
+    return {
+      turns: 0,
+    };
+  }
+
+  return {
+    sessionId: item.sessionId,
+    turns: item.turns ?? 0,
+  };
 };
 
-// Put Session ID
-const putSessionId = async (channel: string, threadTs: string, sessionId: string): Promise<void> => {
+// Put Session
+const putSession = async (channel: string, threadTs: string, sessionId: string, turns: number): Promise<void> => {
   const ttl = Math.floor(Date.now() / 1000) + 60 * 60 * 24;
 
-  await dynamodb.send(new PutCommand({
+  await dynamodb.send(new UpdateCommand({
     TableName: sessionTableName,
-    Item: {
+    Key: {
       channel,
       threadTs,
-      sessionId,
-      ttl,
+    },
+    UpdateExpression: 'SET sessionId = :sessionId, turns = :turns, #ttl = :ttl',
+    ExpressionAttributeNames: {
+      '#ttl': 'ttl',
+    },
+    ExpressionAttributeValues: {
+      ':sessionId': sessionId,
+      ':turns': turns,
+      ':ttl': ttl,
     },
   }));
 };
 
+// Acquire Session Lock
+const acquireSessionLock = async (channel: string, threadTs: string, owner: string): Promise<boolean> => {
+  const now = Math.floor(Date.now() / 1000);
+
+  try {
+    await dynamodb.send(new UpdateCommand({
+      TableName: sessionTableName,
+      Key: {
+        channel,
+        threadTs,
+      },
+      UpdateExpression: 'SET lockOwner = :owner, lockedUntil = :lockedUntil, #ttl = if_not_exists(#ttl, :ttl)',
+      ConditionExpression: 'attribute_not_exists(lockedUntil) OR lockedUntil < :now',
+      ExpressionAttributeNames: {
+        '#ttl': 'ttl',
+      },
+      ExpressionAttributeValues: {
+        ':owner': owner,
+        ':lockedUntil': now + sessionLockTimeout,
+        ':now': now,
+        ':ttl': now + 60 * 60 * 24,
+      },
+    }));
+
+    return true;
+  } catch (e) {
+    if (e instanceof ConditionalCheckFailedException) {
+      return false;
+    }
+
+    throw e;
+  }
+};
+
+// Release Session Lock
+const releaseSessionLock = async (channel: string, threadTs: string, owner: string): Promise<boolean> => {
+  try {
+    await dynamodb.send(new UpdateCommand({
+      TableName: sessionTableName,
+      Key: {
+        channel,
+        threadTs,
+      },
+      UpdateExpression: 'REMOVE lockOwner, lockedUntil',
+      ConditionExpression: 'lockOwner = :owner AND attribute_not_exists(pendingTexts)',
+      ExpressionAttributeValues: {
+        ':owner': owner,
+      },
+    }));
+
+    return true;
+  } catch (e) {
+    if (e instanceof ConditionalCheckFailedException) {
+      return false;
+    }
+
+    throw e;
+  }
+};
+
+// Discard Session Lock
+const discardSessionLock = async (channel: string, threadTs: string, owner: string): Promise<void> => {
+  try {
+    await dynamodb.send(new UpdateCommand({
+      TableName: sessionTableName,
+      Key: {
+        channel,
+        threadTs,
+      },
+      UpdateExpression: 'REMOVE lockOwner, lockedUntil, pendingTexts',
+      ConditionExpression: 'lockOwner = :owner',
+      ExpressionAttributeValues: {
+        ':owner': owner,
+      },
+    }));
+  } catch (e) {
+    if (!(e instanceof ConditionalCheckFailedException)) {
+      throw e;
+    }
+  }
+};
+
+// Put Pending Text
+const putPendingText = async (channel: string, threadTs: string, text: string): Promise<boolean> => {
+  const now = Math.floor(Date.now() / 1000);
+
+  try {
+    await dynamodb.send(new UpdateCommand({
+      TableName: sessionTableName,
+      Key: {
+        channel,
+        threadTs,
+      },
+      UpdateExpression: 'SET pendingTexts = list_append(if_not_exists(pendingTexts, :empty), :texts)',
+      ConditionExpression: 'lockedUntil >= :now',
+      ExpressionAttributeValues: {
+        ':empty': [],
+        ':texts': [text],
+        ':now': now,
+      },
+    }));
+
+    return true;
+  } catch (e) {
+    if (e instanceof ConditionalCheckFailedException) {
+      return false;
+    }
+
+    throw e;
+  }
+};
+
+// Take Pending Texts
+const takePendingTexts = async (channel: string, threadTs: string, owner: string): Promise<string[] | undefined> => {
+  const now = Math.floor(Date.now() / 1000);
+
+  try {
+    const { Attributes: attributes } = await dynamodb.send(new UpdateCommand({
+      TableName: sessionTableName,
+      Key: {
+        channel,
+        threadTs,
+      },
+      UpdateExpression: 'SET lockedUntil = :lockedUntil REMOVE pendingTexts',
+      ConditionExpression: 'lockOwner = :owner',
+      ExpressionAttributeValues: {
+        ':owner': owner,
+        ':lockedUntil': now + sessionLockTimeout,
+      },
+      ReturnValues: 'UPDATED_OLD',
+    }));
+
+    return attributes?.pendingTexts ?? [];
+  } catch (e) {
+    if (e instanceof ConditionalCheckFailedException) {
+      return undefined;
+    }
+
+    throw e;
+  }
+};
+
 // Get Reference
 const getReference = async (messageId: string, no: number): Promise<RetrievedReference | undefined> => {
+  // Reference Cache Key
+  const key = `${messageId}-${no}`;
+
+  if (referenceCache.has(key)) {
+    return referenceCache.get(key);
+  }
+
   const { Item: item } = await dynamodb.send(new GetCommand({
     TableName: referenceTableName,
     Key: {
@@ -410,11 +704,20 @@ const getReference = async (messageId: string, no: number): Promise<RetrievedRef
     },
   }));
 
+  if (item?.reference) {
+    cacheReference(key, item.reference);
+  }
+
   return item?.reference;
 };
 
 // Put References
 const putReferences = async (messageId: string, references: RetrievedReference[]): Promise<void> => {
+  // Cache references for this container.
+  references.forEach((reference, i) => {
+    cacheReference(`${messageId}-${i + 1}`, reference);
+  });
+
   await Promise.all(splitArrayEqually(references, 25).map((references, i) => {
     return dynamodb.send(new BatchWriteCommand({
       RequestItems: {
@@ -432,9 +735,28 @@ const putReferences = async (messageId: string, references: RetrievedReference[]
   }));
 };
 
+// Cache Reference
+const cacheReference = (key: string, reference: RetrievedReference): void => {
+  // Evict the oldest reference if the cache is full.
+  if (referenceCache.size >= referenceCacheSize) {
+    referenceCache.delete(referenceCache.keys().next().value);
+  }
+
+  referenceCache.set(key, reference);
+};
+
+// Get Bedrock Agent
+const getBedrockAgent = async (): Promise<BedrockAgentClient> => {
+  const { BedrockAgentClient } = await import('@aws-sdk/client-bedrock-agent');
+
+  return bedrockAgent ??= new BedrockAgentClient();
+};
+
 // Start Ingestion Job
 const startIngestionJob = async (knowledgeBaseId: string, dataSourceId: string): Promise<string | undefined> => {
-  const { ingestionJob } = await bedrockAgent.send(new StartIngestionJobCommand({
+  const { StartIngestionJobCommand } = await import('@aws-sdk/client-bedrock-agent');
+
+  const { ingestionJob } = await (await getBedrockAgent()).send(new StartIngestionJobCommand({
     knowledgeBaseId,
     dataSourceId,
   }));
@@ -444,7 +766,9 @@ const startIngestionJob = async (knowledgeBaseId: string, dataSourceId: string):
 
 // Get Ingestion Job Status
 const getIngestionJobStatus = async (knowledgeBaseId: string, dataSourceId: string, ingestionJobId: string): Promise<IngestionJobStatus | undefined> => {
-  const { ingestionJob } = await bedrockAgent.send(new GetIngestionJobCommand({
+  const { GetIngestionJobCommand } = await import('@aws-sdk/client-bedrock-agent');
+
+  const { ingestionJob } = await (await getBedrockAgent()).send(new GetIngestionJobCommand({
     knowledgeBaseId,
     dataSourceId,
     ingestionJobId,
@@ -478,6 +802,31 @@ const putFiles = async (files: File[]): Promise<void> => {
 
 // Post Message
 const postMessage = async (client: WebClient, channel: string, threadTs: string, text: string, references: RetrievedReference[] = []): Promise<string> => {
+  const { ts } = await client.chat.postMessage({
+    channel,
+    text,
+    blocks: createBlocks(text, references),
+    thread_ts: threadTs,
+  });
+
+  return ts ?? '';
+};
+
+// Update Message
+const updateMessage = async (client: WebClient, channel: string, ts: string, text: string, references: RetrievedReference[] = []): Promise<string> => {
+  await client.chat.update({
+    channel,
+    ts,
+    text,
+    blocks: createBlocks(text, references),
+  });
+
+  // Message ID
+  return `${channel}-${ts}`;
+};
+
+// Create Blocks
+const createBlocks = (text: string, references: RetrievedReference[]): KnownBlock[] => {
   // Blocks
   const blocks: KnownBlock[] = [
     {
@@ -516,21 +865,15 @@ const postMessage = async (client: WebClient, channel: string, threadTs: string,
     });
   });
 
-  // Post message.
-  const { ts } = await client.chat.postMessage({
-    channel,
-    text,
-    blocks,
-    thread_ts: threadTs,
-  });
-
-  // Message ID
-  return `${channel}-${ts}`;
+  return blocks;
 };
 
+// Mention Pattern
+const mentionPattern = /<[!#@][^>]*>\s*/g;
+
 // Normalize
 const normalize = (text: string): string => {
-  return text.replace(/<[!#@].*?>\s*/g, '');
+  return text.replace(mentionPattern, '');
 };
 
 // Omit
@@ -556,17 +899,82 @@ const getPathNameFromUri = (uri: string): string => {
 };
 
 // Lambda Handler
-export const handler: ReturnType<typeof receiver.toHandler> = async (event, context, callback) => {
+export const handler = awslambda.streamifyResponse<AwsEvent>(async (event, responseStream, context) => {
   if (event.headers['x-slack-retry-num']) {
-    return {
+    return writeResponse(responseStream, {
       statusCode: 200,
       body: JSON.stringify({
         message: 'OK',
       }),
-    };
+    });
   }
 
-  return await receiver.start().then((handler) => {
-    return handler(event, context, callback);
+  // Body
+  const body = getBody(event);
+
+  // Acknowledge signed event callbacks before processing them so that Slack does not retry.
+  // Unsigned requests fall through to the receiver, which rejects them with 401.
+  if (isEventCallback(body) && isValidSignature(event, body)) {
+    writeResponse(responseStream, {
+      statusCode: 200,
+      body: '',
+    });
+
+    await slackHandler(event, context, () => {});
+  } else {
+    writeResponse(responseStream, await slackHandler(event, context, () => {}));
+  }
+});
+
+// Get Body
+const getBody = ({ body, isBase64Encoded }: AwsEvent): string => {
+  return isBase64Encoded ? Buffer.from(body ?? '', 'base64').toString() : body ?? '';
+};
+
+// Is Event Callback
+const isEventCallback = (body: string): boolean => {
+  try {
+    return JSON.parse(body).type === 'event_callback';
+  } catch {
+    return false;
+  }
+};
+
+// Is Valid Signature
+const isValidSignature = ({ headers }: AwsEvent, body: string): boolean => {
+  const [signature, timestamp] = [
+    headers['x-slack-signature'],
+    headers['x-slack-request-timestamp'],
+  ];
+
+  if (!signature || !timestamp) {
+    return false;
+  }
+
+  // Reject requests older than 5 minutes.
+  if (!(Math.abs(Date.now() / 1000 - Number(timestamp)) <= 60 * 5)) {
+    return false;
+  }
+
+  // Signatures
+  const [actual, expected] = [
+    Buffer.from(signature),
+    Buffer.from(`v0=${createHmac('sha256', slackSigningSecret).update(`v0:${timestamp}:${body}`).digest('hex')}`),
+  ];
+
+  return actual.length === expected.length && timingSafeEqual(actual, expected);
+};
+
+// Write Response
+const writeResponse = (responseStream: awslambda.ResponseStream, { statusCode, headers, body }: AwsResponse): void => {
+  const httpResponseStream = awslambda.HttpResponseStream.from(responseStream, {
+    statusCode,
+    headers: Object.entries(headers ?? {}).reduce<Record<string, string>>((headers, [name, value]) => {
+      headers[name] = String(value);
+      return headers;
+    }, {}),
   });
+
+  httpResponseStream.write(body);
+  httpResponseStream.end();
 };
@@ -93,6 +93,7 @@ class SeedsBotStack extends Stack {
     // Add function url to Api.
     const { url: apiEndpoint } = api.addFunctionUrl({
       authType: lambda.FunctionUrlAuthType.NONE,
+      invokeMode: lambda.InvokeMode.RESPONSE_STREAM,
     });
 
     // Api Endpoint
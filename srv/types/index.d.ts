@@ -3,3 +3,23 @@ declare namespace NodeJS {
     [key: string]: string;
   }
 }
+
+declare namespace awslambda {
+  interface ResponseStream extends NodeJS.WritableStream {
+    setContentType(contentType: string): void;
+  }
+
+  interface HttpResponseMetadata {
+    statusCode?: number;
+    headers?: Record<string, string>;
+    cookies?: string[];
+  }
+
+  type StreamifyHandler<TEvent> = (event: TEvent, responseStream: ResponseStream, context: any) => Promise<void>;
+
+  function streamifyResponse<TEvent>(handler: StreamifyHandler<TEvent>): StreamifyHandler<TEvent>;
+
+  namespace HttpResponseStream {
+    function from(responseStream: ResponseStream, metadata: HttpResponseMetadata): ResponseStream;
+  }
+}